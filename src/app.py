@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -81,25 +81,41 @@ activities = {
 }
 
 
+class ActivitiesStore:
+    """Holds the activities served by the API"""
+
+    def __init__(self, activities):
+        self.activities = activities
+
+
+store = ActivitiesStore(activities)
+
+
+def get_store():
+    """Provide the activities store; tests override this dependency"""
+    return store
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities(store: ActivitiesStore = Depends(get_store)):
+    return store.activities
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        store: ActivitiesStore = Depends(get_store)):
     """Sign up a student for an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in store.activities:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = store.activities[activity_name]
 
     # Validate student is not already signed up
     if email in activity["participants"]:
@@ -111,14 +127,15 @@ def signup_for_activity(activity_name: str, email: str):
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             store: ActivitiesStore = Depends(get_store)):
     """Unregister a student from an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in store.activities:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = store.activities[activity_name]
 
     # Validate student is registered for the activity
     if email not in activity["participants"]:
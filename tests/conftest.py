@@ -1,51 +1,49 @@
 """
 Test configuration and fixtures for the Mergington High School Activities API
 """
+import httpx
+import pickle
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+import pytest_asyncio
+from src.app import ActivitiesStore, activities, app, get_store
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Create an async test client for the FastAPI app, shared across the session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warmup(client):
+    """Exercise each route once so cold-start costs stay out of the first test."""
+    email = "warmup@mergington.edu"
+    await client.get("/activities")
+    await client.post("/activities/Chess%20Club/signup", params={"email": email})
+    await client.delete("/activities/Chess%20Club/unregister", params={"email": email})
+
+
+# Pristine seed data, serialized once at import; unpickling is a cheaper deep copy
+_PRISTINE_BLOB = pickle.dumps(activities)
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test."""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-    }
-    
-    # Reset activities to original state
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Clean up after test
-    activities.clear()
-    activities.update(original_activities)
+def store():
+    """Provide an isolated activities store to the app for each test."""
+    test_store = ActivitiesStore(pickle.loads(_PRISTINE_BLOB))
+    app.dependency_overrides[get_store] = lambda: test_store
+
+    yield test_store
+
+    app.dependency_overrides.pop(get_store, None)
+
+
+@pytest.fixture(scope="session")
+def initial_activities_snapshot():
+    """Snapshot of the initial activities state, captured once per session."""
+    return pickle.loads(_PRISTINE_BLOB)
 
 
 @pytest.fixture